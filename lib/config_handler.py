@@ -1,11 +1,17 @@
 """Configuration handling for the oAW to RST generator."""
 
 from __future__ import annotations
-import argparse
-import json
+import functools
+import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from types import SimpleNamespace
+from typing import Dict, List
+try:
+    from orjson import loads as _loads  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    from json import loads as _loads
 from .utils import report_error
 
 
@@ -13,9 +19,12 @@ from .utils import report_error
 DEFAULT_CONFIG_RELATIVE_PATH = Path("config/config.json")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
-    """Resolved configuration values for the generator."""
+    """Resolved configuration values for the generator.
+
+    ``test_path`` and ``spec_path`` are absolute but not symlink-resolved.
+    """
 
     component: str
     test_path: Path
@@ -23,8 +32,13 @@ class Config:
     group_name_mappings: Dict[str, str]
 
 
-def _parse_arguments() -> argparse.Namespace:
-    """Parse command-line arguments for the generator."""
+_CLI_OPTIONS = ("config", "component", "test_path", "spec_path")
+
+
+def _parse_with_argparse(args: List[str]) -> SimpleNamespace:
+    """Parse ``args`` with the full parser (used for help and error reporting)."""
+
+    import argparse
 
     parser = argparse.ArgumentParser(description="oAW to RST generator")
     parser.add_argument(
@@ -36,7 +50,41 @@ def _parse_arguments() -> argparse.Namespace:
     parser.add_argument("--component", type=str, help="Component name", default=None)
     parser.add_argument("--test_path", type=str, help="Path to test files", default=None)
     parser.add_argument("--spec_path", type=str, help="Path to spec files", default=None)
-    return parser.parse_args()
+    return SimpleNamespace(**vars(parser.parse_args(args)))
+
+
+def _parse_arguments(argv: List[str] | None = None) -> SimpleNamespace:
+    """Parse command-line arguments for the generator.
+
+    The known ``--name value`` / ``--name=value`` options are scanned directly
+    to avoid importing :mod:`argparse`; anything else (``--help``, unknown or
+    incomplete options) is delegated to the full parser.
+    """
+
+    args = sys.argv[1:] if argv is None else argv
+    opts: Dict[str, str | None] = dict.fromkeys(_CLI_OPTIONS)
+    idx = 0
+    while idx < len(args):
+        arg = args[idx]
+        name, sep, value = arg[2:].partition("=")
+        if not arg.startswith("--") or name not in opts:
+            return _parse_with_argparse(args)
+        if not sep:
+            idx += 1
+            if idx >= len(args) or args[idx].startswith("-"):
+                return _parse_with_argparse(args)
+            value = args[idx]
+        opts[name] = value
+        idx += 1
+    return SimpleNamespace(**opts)
+
+
+def _absolute(base_dir: str, path_str: str) -> str:
+    """Return ``path_str`` made absolute against ``base_dir`` using string operations."""
+
+    if os.path.isabs(path_str):
+        return path_str
+    return os.path.abspath(os.path.join(base_dir, path_str))
 
 
 def _resolve_config_path(script_path: Path, config_arg: str | None) -> tuple[Path, Path]:
@@ -44,8 +92,7 @@ def _resolve_config_path(script_path: Path, config_arg: str | None) -> tuple[Pat
 
     script_dir = script_path.parent
     if config_arg:
-        specified = Path(config_arg)
-        config_path = specified if specified.is_absolute() else (script_dir / specified).resolve()
+        config_path = Path(_absolute(os.fspath(script_dir), config_arg))
     else:
         config_path = script_dir / DEFAULT_CONFIG_RELATIVE_PATH
     if not config_path.exists():
@@ -54,10 +101,12 @@ def _resolve_config_path(script_path: Path, config_arg: str | None) -> tuple[Pat
 
 
 def _load_raw_config(config_path: Path) -> Dict[str, object]:
-    """Load raw JSON configuration."""
+    """Load raw JSON configuration.
+
+    Uses ``orjson`` when available; both decoders accept UTF-8 bytes.
+    """
 
-    with config_path.open("r", encoding="utf-8") as file:
-        return json.load(file)
+    return _loads(config_path.read_bytes())
 
 
 def _normalize_group_mappings(config_path: Path, raw_mappings: object) -> Dict[str, str]:
@@ -69,7 +118,18 @@ def _normalize_group_mappings(config_path: Path, raw_mappings: object) -> Dict[s
             1,
             "Invalid or missing 'group_name_mappings' in configuration",
         )
-    mappings: Dict[str, str] = {}
+    # Fast path: decoded JSON keys are always strings, so well-formed input
+    # only needs one comprehension. Any bad entry falls through to the
+    # per-item validation below, which reports it.
+    try:
+        mappings = {key.strip().lower(): value.strip() for key, value in raw_mappings.items()}
+    except AttributeError:
+        pass
+    else:
+        if "" not in mappings:
+            return mappings
+
+    mappings = {}
     for key, value in raw_mappings.items():
         if not isinstance(key, str) or not isinstance(value, str) or not key.strip():
             report_error(
@@ -81,11 +141,27 @@ def _normalize_group_mappings(config_path: Path, raw_mappings: object) -> Dict[s
     return mappings
 
 
+@functools.lru_cache(maxsize=8)
+def _load_cached(config_path: Path, mtime_ns: int, size: int) -> Dict[str, object]:
+    """Load the raw configuration, memoized on the file stamp.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key so an edited
+    configuration file is picked up on the next call. The CLI loads its
+    configuration once per process, so only in-process callers that load
+    repeatedly benefit.
+    """
+
+    return _load_raw_config(config_path)
+
+
 def _resolve_path(base_dir: Path, path_str: str) -> Path:
-    """Convert ``path_str`` to an absolute :class:`Path` relative to ``base_dir``."""
+    """Convert ``path_str`` to an absolute :class:`Path` relative to ``base_dir``.
+
+    The result is normalized lexically and symlinks are left unresolved;
+    callers needing a canonical path can call :meth:`Path.resolve` themselves.
+    """
 
-    path = Path(path_str)
-    return path if path.is_absolute() else (base_dir / path).resolve()
+    return Path(_absolute(os.fspath(base_dir), path_str))
 
 
 def load_config_with_overrides(script_path: Path) -> Config:
@@ -104,12 +180,12 @@ def load_config_with_overrides(script_path: Path) -> Config:
 
     args = _parse_arguments()
     config_path, config_dir = _resolve_config_path(script_path, args.config)
-    raw = _load_raw_config(config_path)
+    stat = os.stat(config_path)
+    raw = _load_cached(config_path, stat.st_mtime_ns, stat.st_size)
 
     component = args.component or raw.get("component")
     test_path_raw = args.test_path or raw.get("test_path")
     spec_path_raw = args.spec_path or raw.get("spec_path")
-    group_name_mappings_raw = raw.get("group_name_mappings")
 
     if not component or not isinstance(component, str):
         report_error(
@@ -130,7 +206,7 @@ def load_config_with_overrides(script_path: Path) -> Config:
             "Invalid or missing 'spec_path' in configuration",
         )
 
-    group_name_mappings = _normalize_group_mappings(config_path, group_name_mappings_raw)
+    group_name_mappings = _normalize_group_mappings(config_path, raw.get("group_name_mappings"))
 
     test_path = _resolve_path(config_dir, test_path_raw)
     spec_path = _resolve_path(config_dir, spec_path_raw)
@@ -1,30 +1,129 @@
 """Generate reStructuredText files from parsed test specifications."""
 
 from __future__ import annotations
+import hashlib
+import io
+import multiprocessing
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple
+from functools import lru_cache
+from heapq import merge
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, List, Tuple
-from textwrap import TextWrapper
+from typing import Callable, Dict, Iterable, List, Tuple
 try:
-    from jinja2 import Environment, FileSystemLoader  # type: ignore
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
     Environment = None  # type: ignore
+    FileSystemBytecodeCache = None  # type: ignore
     FileSystemLoader = None  # type: ignore
-from .utils import report_error, report_warning
+from .utils import (
+    flag_warnings,
+    flush_warnings,
+    has_warnings,
+    load_json_cache,
+    print_lines,
+    report_error,
+    report_warning,
+    save_json_cache,
+)
 from .file_handler import TscHeader
 
+GROUP_TEMPLATE_NAME = "oaw_test_group.rst.j2"
+# Per-component sidecar file, next to the TOC, recording what each group file
+# was built from. Components sharing a TOC directory keep separate caches.
+GROUP_CACHE_NAME = ".{component}_oaw_cache.json"
+# Bump whenever the generated RST changes for unchanged inputs.
+_GROUP_CACHE_VERSION = 1
+
+# Fewest rendered steps for which a process pool beats rendering in-process.
+# Measured with the example headers: in-process rendering costs ~9 us per
+# step; a fork pool adds ~15 ms startup plus ~2.5 us per step of transfer,
+# and a spawn pool (Windows/macOS) ~240 ms startup. With four workers the
+# pool only pays off above these sizes.
+_PARALLEL_MIN_STEPS = {"fork": 4000}
+_PARALLEL_MIN_STEPS_DEFAULT = 60000
+
+
+@lru_cache(maxsize=None)
+def _get_env(template_dir: str) -> "Environment":
+    """Return a Jinja2 environment for ``template_dir``, built once per run.
+
+    Compiled templates are persisted in Jinja2's per-user bytecode cache
+    directory so later runs skip parsing and code generation. The cache is
+    optional: if no safe cache directory can be set up, templates are simply
+    compiled on every run.
+    """
+
+    try:
+        bytecode_cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        bytecode_cache = None
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=bytecode_cache,
+        autoescape=False,
+        trim_blocks=False,
+        lstrip_blocks=False,
+        keep_trailing_newline=True,
+        cache_size=-1,
+        auto_reload=False,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_template(template_dir: str, name: str):
+    """Return the compiled template ``name`` from ``template_dir``."""
+
+    return _get_env(template_dir).get_template(name)
+
 
 def convert_group_name(group: str, group_name_mappings: Dict[str, str]) -> str:
     """Map ``group`` to its configured display name."""
 
-    lower = group.lower()
-    return group_name_mappings.get(lower, group)
+    return group_name_mappings.get(group.lower(), group)
+
+
+def _find_shallowest(root: str, name: str) -> Path | None:
+    """Breadth-first search for a file called ``name`` below ``root``."""
+
+    pending = deque([root])
+    while pending:
+        directory = pending.popleft()
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == name and entry.is_file():
+                        return Path(entry.path)
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        pending.extend(sorted(subdirs))
+    return None
+
+
+def group_rst_filename(component: str, group: str, group_name_mappings: Dict[str, str]) -> str:
+    """Return the file name of the generated RST for ``group``."""
+
+    return _group_rst_name(component, convert_group_name(group, group_name_mappings))
+
+
+def _group_rst_name(component: str, group_conv: str) -> str:
+    """Return the file name of the generated RST for a converted group name."""
+
+    return f"{component}_oAW_{group_conv}_Tests.rst"
 
 
 def find_toc_rst(component: str, spec_path: Path) -> Path:
     """Locate the component's TOC RST file by searching recursively.
 
-    Searches depth-first under ``spec_path`` for ``{component}_component_test.rst``.
-    Raises an error if not found.
+    Searches breadth-first under ``spec_path`` for ``{component}_component_test.rst``
+    so the shallowest match wins. Raises an error if not found.
     """
 
     toc_name = f"{component}_component_test.rst"
@@ -34,12 +133,9 @@ def find_toc_rst(component: str, spec_path: Path) -> Path:
     if candidate.exists():
         found = candidate
     else:
-        # Search recursively under spec_path
-        matches = list(spec_path.rglob(toc_name))
-        if not matches:
+        found = _find_shallowest(str(spec_path), toc_name)
+        if found is None:
             report_error(candidate, 1, f"{toc_name} not found under {spec_path}")
-        # Prefer the first match (Path.rglob returns in directory order)
-        found = matches[0]
 
     print("Table of content rst file:")
     print(f"{found}")
@@ -47,91 +143,192 @@ def find_toc_rst(component: str, spec_path: Path) -> Path:
     return found.resolve()
 
 
-def cleanup_generated_group_files(component: str, toc_path: Path) -> None:
-    """Remove previously generated group files to avoid stale data."""
-
-    toc_dir = toc_path.parent
-    print("Deleted old test specification files:")
-    for file in toc_dir.glob(f"{component}_oAW_*.rst"):
-        if file == toc_path:
-            continue
-        try:
-            file.unlink()
-            print(f"{file}")
-        except Exception as ex:
-            report_error(file, 1, f"Failed to delete file: {ex}")
+def cleanup_generated_group_files(
+    component: str, toc_path: Path, keep: Iterable[str] = ()
+) -> None:
+    """Remove previously generated group files to avoid stale data.
 
+    File names in ``keep`` are left in place; the generation step rewrites
+    them unless they are already up to date.
+    """
 
-def remove_generated_lines_from_toc(component: str, toc_path: Path) -> None:
-    """Strip previously added group entries from the TOC file."""
+    prefix = f"{component}_oAW_"
+    print("Deleted old test specification files:")
+    deleted: List[str] = []
+    keep = frozenset(keep)
+    with os.scandir(toc_path.parent) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith(prefix) and name.endswith(".rst")) or name == toc_path.name:
+                continue
+            if name in keep:
+                continue
+            if not entry.is_file():
+                continue
+            try:
+                os.unlink(entry.path)
+            except Exception as ex:
+                print_lines(deleted)
+                report_error(Path(entry.path), 1, f"Failed to delete file: {ex}")
+            deleted.append(entry.path)
+    print_lines(deleted)
+
+
+def _read_toc(toc_path: Path) -> Tuple[bytes, str]:
+    """Return the raw TOC bytes and their text with ``\n`` line endings.
+
+    The text is normalized like a text-mode read; a fatal error is reported
+    on failure.
+    """
 
     try:
-        text = toc_path.read_text(encoding="utf-8")
+        data = toc_path.read_bytes()
+        return data, data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
     except Exception as ex:
         report_error(toc_path, 1, f"Failed to read TOC file: {ex}")
-    lines = text.splitlines()
-    prefix = f"{component}_oAW_"
-    filtered = [ln for ln in lines if not ln.lstrip().startswith(prefix)]
+
+
+def _write_toc(toc_path: Path, data: bytes) -> None:
+    """Write ``data`` to the TOC file, reporting a fatal error on failure."""
+
     try:
-        toc_path.write_text("\n".join(filtered) + "\n", encoding="utf-8")
+        toc_path.write_bytes(data)
     except Exception as ex:
         report_error(toc_path, 1, f"Failed to write TOC file: {ex}")
 
 
-def append_group_links_to_toc(
-    component: str, groups: List[str], toc_path: Path, group_name_mappings: Dict[str, str]
-) -> None:
-    """Append group-specific RST links to the TOC file."""
+def _encode_text(text: str) -> bytes:
+    """Encode ``text`` as UTF-8 with platform line endings, as a text-mode write does."""
+
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _generated_line_pattern(component: str) -> "re.Pattern[str]":
+    """Compile the pattern matching whole TOC lines that link generated files."""
+
+    prefix = re.escape(f"{component}_oAW_")
+    return re.compile(r"(?m)^[^\S\n]*" + prefix + r".*(?:\n|$)")
+
+
+def _strip_generated_lines(component: str, text: str) -> str:
+    """Return ``text`` without lines referencing generated group files."""
+
+    filtered = _generated_line_pattern(component).sub("", text)
+    if not filtered.endswith("\n"):
+        filtered += "\n"
+    return filtered
 
-    try:
-        text = toc_path.read_text(encoding="utf-8")
-    except Exception as ex:
-        report_error(toc_path, 1, f"Failed to read TOC file: {ex}")
+
+def _group_link_block(
+    component: str, groups: List[str], group_name_mappings: Dict[str, str]
+) -> str:
+    """Return the TOC link lines for ``groups``, newline-terminated."""
 
     appended_lines: List[str] = []
     for group in groups:
-        group_conv = convert_group_name(group, group_name_mappings)
-        filename = f"{component}_oAW_{group_conv}_Tests.rst"
-        appended_lines.append("   " + filename)
+        appended_lines.append("   " + group_rst_filename(component, group, group_name_mappings))
+    return "\n".join(appended_lines) + "\n"
 
-    if not text.endswith("\n"):
-        text += "\n"
-    text += "\n".join(appended_lines) + "\n"
-    try:
-        toc_path.write_text(text, encoding="utf-8")
-    except Exception as ex:
-        report_error(toc_path, 1, f"Failed to write TOC file: {ex}")
 
+def _append_group_links(
+    component: str, groups: List[str], text: str, group_name_mappings: Dict[str, str]
+) -> str:
+    """Return ``text`` with one link line appended per group."""
 
-def format_tests_value(tags: List[str], delimiter: str, max_width: int, indent_spaces: int) -> str:
-    """Wrap requirement tags into a single formatted string."""
+    separator = "" if text.endswith("\n") else "\n"
+    return text + separator + _group_link_block(component, groups, group_name_mappings)
 
-    if not tags:
-        return ""
-    tokens = [f"{tag}," for tag in tags[:-1]] + [tags[-1]]
-    text = delimiter.join(tokens)
-    wrapper = TextWrapper(
-        width=max_width,
-        subsequent_indent=" " * indent_spaces,
-        break_long_words=False,
+
+def _rewrite_toc(toc_path: Path, edit: Callable[[str], str]) -> None:
+    """Apply ``edit`` to the TOC text, writing the file only if it changes.
+
+    Opening for writing only on change lets no-op runs succeed on a
+    read-only TOC.
+    """
+
+    original, text = _read_toc(toc_path)
+    data = _encode_text(edit(text))
+    if data != original:
+        _write_toc(toc_path, data)
+
+
+def update_toc(
+    component: str, groups: List[str], toc_path: Path, group_name_mappings: Dict[str, str]
+) -> None:
+    """Replace generated group links in the TOC file with a single read and write."""
+
+    _rewrite_toc(
+        toc_path,
+        lambda text: _append_group_links(
+            component, groups, _strip_generated_lines(component, text), group_name_mappings
+        ),
+    )
+
+
+def remove_generated_lines_from_toc(component: str, toc_path: Path) -> None:
+    """Strip previously added group entries from the TOC file.
+
+    Prefer :func:`update_toc` when links are appended afterwards.
+    """
+
+    _rewrite_toc(toc_path, lambda text: _strip_generated_lines(component, text))
+
+
+def append_group_links_to_toc(
+    component: str, groups: List[str], toc_path: Path, group_name_mappings: Dict[str, str]
+) -> None:
+    """Append group-specific RST links to the TOC file.
+
+    Prefer :func:`update_toc` when stale links are removed beforehand.
+    """
+
+    _rewrite_toc(
+        toc_path,
+        lambda text: _append_group_links(component, groups, text, group_name_mappings),
     )
-    return wrapper.fill(text)
 
 
-def format_multiline_field(label: str, text: str, base_indent_spaces: int = 6) -> List[str]:
-    """Format a header field into indented lines for RST output."""
+def format_tests_value(tags: List[str], delimiter: str, max_width: int, indent_spaces: int) -> str:
+    """Wrap requirement tags into a single formatted string.
+
+    Tags are never split; a tag longer than the available width gets a line
+    of its own. Continuation lines are indented by ``indent_spaces``.
+    """
+
+    if not tags:
+        return ""
+    tokens = [f"{tag}," for tag in tags[:-1]]
+    tokens.append(tags[-1])
+    newline = "\n" + " " * indent_spaces
+    gap = len(delimiter)
+    parts = [tokens[0]]
+    col = len(tokens[0])
+    avail = max_width
+    for token in tokens[1:]:
+        if col + gap + len(token) > avail:
+            parts.append(newline)
+            avail = max_width - indent_spaces
+            col = len(token)
+        else:
+            parts.append(delimiter)
+            col += gap + len(token)
+        parts.append(token)
+    return "".join(parts)
+
+
+def format_multiline_field(label: str, text: str, base_indent_spaces: int = 6) -> str:
+    """Format a header field into an indented, newline-joined RST block.
+
+    ``text`` is expected to use ``\\n`` line endings, as produced by the parser.
+    """
 
-    lines: List[str] = []
     indent = " " * base_indent_spaces
     value_indent = " " * (base_indent_spaces + len(label) + 2)
-    parts = text.splitlines() if text else [""]
-    if parts:
-        lines.append(f"{indent}{label}: {parts[0] if parts[0] else ''}")
-        for cont in parts[1:]:
-            lines.append(f"{value_indent}{cont}")
-    else:
-        lines.append(f"{indent}{label}:")
-    return lines
+    parts = text.split("\n")
+    return f"{indent}{label}: " + ("\n" + value_indent).join(parts)
 
 
 def generate_group_rst(
@@ -145,41 +342,235 @@ def generate_group_rst(
     """Render the RST file for a specific group of tests."""
 
     group_conv = convert_group_name(group, group_name_mappings)
-    out_path = toc_dir / f"{component}_oAW_{group_conv}_Tests.rst"
-
-    # Aggregate group tags
-    all_tags_set = set()
-    for _, hdr in parsed:
-        for t in hdr.requirements:
-            all_tags_set.add(t)
-    all_tags = sorted(all_tags_set)
+    out_path = _render_group_rst(
+        component,
+        group,
+        group_conv,
+        parsed,
+        toc_dir / _group_rst_name(component, group_conv),
+        template_dir,
+    )
+    print(f"{out_path}")
+    return out_path
+
+
+def _render_group_worker(job: tuple) -> Tuple[Path, bool]:
+    """Process-pool entry point; returns the output path and warning state."""
+
+    out_path = _render_group_rst(*job)
+    # Pool workers may exit without running atexit hooks.
+    flush_warnings()
+    return out_path, has_warnings()
+
+
+@lru_cache(maxsize=None)
+def _renderer_digest(template_dir: Path) -> bytes:
+    """Digest of the active renderer and the group template source."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(b"jinja2" if Environment is not None else b"fallback")
+    try:
+        digest.update((template_dir / GROUP_TEMPLATE_NAME).read_bytes())
+    except OSError:
+        pass
+    return digest.digest()
+
+
+def _group_fingerprint(
+    component: str,
+    group: str,
+    group_conv: str,
+    parsed: List[Tuple[Path, TscHeader]],
+    template_dir: Path,
+) -> str:
+    """Return a digest of everything the RST file for ``group`` is built from."""
+
+    payload = repr(
+        (
+            _GROUP_CACHE_VERSION,
+            component,
+            group,
+            group_conv,
+            [(os.fspath(path), astuple(header)) for path, header in parsed],
+        )
+    )
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16)
+    digest.update(_renderer_digest(template_dir))
+    return digest.hexdigest()
+
+
+def _cache_entry(digest: str, out_path: Path) -> Dict[str, object] | None:
+    """Return the cache entry for a freshly written ``out_path``."""
+
+    try:
+        stat = os.stat(out_path)
+    except OSError:
+        return None
+    return {"digest": digest, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _is_current(entry: object, digest: str, out_path: Path) -> bool:
+    """Return True if ``out_path`` was written from ``digest`` and not touched since."""
+
+    if not isinstance(entry, dict) or entry.get("digest") != digest:
+        return False
+    return _cache_entry(digest, out_path) == entry
+
+
+def generate_group_rsts(
+    component: str,
+    parsed_groups: Dict[str, List[Tuple[Path, TscHeader]]],
+    toc_dir: Path,
+    template_dir: Path,
+    group_name_mappings: Dict[str, str],
+) -> List[Path]:
+    """Render the RST files for all groups.
+
+    Large workloads (see :data:`_PARALLEL_MIN_STEPS`) are rendered with one
+    worker process per group; smaller ones in-process, where the pool's
+    startup cost would dominate.
+
+    Groups whose inputs match the fingerprint recorded in the component's
+    :data:`GROUP_CACHE_NAME` keep their existing file, provided it was not
+    modified since. Output paths are printed in group order regardless of
+    completion order. Warnings raised inside workers are propagated to this
+    process.
+    """
+
+    cache_path = toc_dir / GROUP_CACHE_NAME.format(component=component)
+    cache = load_json_cache(cache_path)
+    new_cache: Dict[str, dict] = {}
+    out_paths: List[Path] = []
+    jobs = []
+    digests: Dict[Path, str] = {}
+    for group, parsed in parsed_groups.items():
+        group_conv = convert_group_name(group, group_name_mappings)
+        out_path = toc_dir / _group_rst_name(component, group_conv)
+        out_paths.append(out_path)
+        digest = _group_fingerprint(component, group, group_conv, parsed, template_dir)
+        entry = cache.get(out_path.name)
+        if _is_current(entry, digest, out_path):
+            # Still report the header problems the file was generated with.
+            _report_missing_fields(parsed)
+            new_cache[out_path.name] = entry
+        else:
+            digests[out_path] = digest
+            jobs.append((component, group, group_conv, parsed, out_path, template_dir))
+
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1 and _count_steps(jobs) < _PARALLEL_MIN_STEPS.get(
+        multiprocessing.get_start_method(), _PARALLEL_MIN_STEPS_DEFAULT
+    ):
+        workers = 1
+    if workers <= 1:
+        for job in jobs:
+            _render_group_rst(*job)
+    else:
+        if Environment is not None:
+            # Compile once here so forked workers inherit the cached template.
+            _get_template(str(template_dir), GROUP_TEMPLATE_NAME)
+        # Forked workers inherit the warning buffer; empty it first so each
+        # warning is written exactly once.
+        flush_warnings()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for _, warned in executor.map(_render_group_worker, jobs):
+                if warned:
+                    flag_warnings()
+
+    for out_path, digest in digests.items():
+        entry = _cache_entry(digest, out_path)
+        if entry is not None:
+            new_cache[out_path.name] = entry
+    if new_cache != cache:
+        save_json_cache(cache_path, new_cache)
+    print_lines(out_paths)
+    return out_paths
+
+
+def _count_steps(jobs: List[tuple]) -> int:
+    """Return the number of step blocks the render ``jobs`` will emit."""
+
+    # One anchor step per file plus one numbered step per 7 tags (at least one).
+    return sum(
+        1 + max(1, -(-len(header.requirements) // 7))
+        for job in jobs
+        for _, header in job[3]
+    )
+
+
+def _report_missing_fields(parsed: List[Tuple[Path, TscHeader]]) -> None:
+    """Warn about every empty header section that is rendered as a TODO."""
+
+    for path, header in parsed:
+        for label, content, line_no in (
+            ("Description", header.description, header.desc_line),
+            ("Input", header.input_text, header.input_line),
+            ("Output", header.output_text, header.output_line),
+            ("Requirements", header.requirements, header.requirements_line),
+        ):
+            if not content:
+                report_warning(
+                    path,
+                    line_no,
+                    f"Missing {label} content; emitting TODO in test specification rst file",
+                )
+
+
+# Group preamble for the renderer used when Jinja2 is unavailable.
+_FALLBACK_GROUP_HEADER = """\
+{title}
+{underline}
+
+{section}
+{section_underline}
+
+.. sw_test:: {section}
+   :id: TS_{section}
+   :tst_shortdescription: Tests for successful {group} of {component}
+   :tst_level: Component Requirement Test
+   :tst_designdoc: {component}_VerificationDocumentation.docx
+   :tst_envconditions: oAW on PC
+   :tst_method: Interface tests/API tests
+   :tst_preparation: nothing specific
+   :tst_type: Manual
+   :tst_env: Generator-Test
+   :tests: {tests_agg}
+   See descriptions below
+"""
+
+
+def _render_group_rst(
+    component: str,
+    group: str,
+    group_conv: str,
+    parsed: List[Tuple[Path, TscHeader]],
+    out_path: Path,
+    template_dir: Path,
+) -> Path:
+    """Write the RST file for one group to ``out_path`` without echoing it."""
+
+    _report_missing_fields(parsed)
+
+    # Aggregate group tags; each header's list is already sorted and unique
+    all_tags = [tag for tag, _ in groupby(merge(*(hdr.requirements for _, hdr in parsed)))]
     tests_agg = format_tests_value(all_tags, delimiter=" ", max_width=120, indent_spaces=11)
 
     # Prepare step contexts
     steps = []
     counter = 1
 
+    # Missing sections were already reported by _report_missing_fields.
     def build_tests_line(path: Path, header: TscHeader) -> str:
         if header.requirements:
             per_file_tests = format_tests_value(
                 header.requirements, delimiter=" ", max_width=120, indent_spaces=14
             )
             return f"      :tests: {per_file_tests}"
-        report_warning(
-            path,
-            header.requirements_line,
-            "Missing Requirements content; emitting TODO in test specification rst file",
-        )
         return f"      :tests: TODO:Update the Requirements field in the header of {path.name}"
 
-    def build_field_lines(label: str, content: str, line_no: int, path: Path) -> List[str]:
+    def build_field_block(label: str, content: str, path: Path) -> str:
         if content:
             return format_multiline_field(label, content, base_indent_spaces=6)
-        report_warning(
-            path,
-            line_no,
-            f"Missing {label} content; emitting TODO in test specification rst file",
-        )
         return format_multiline_field(
             label,
             f"TODO:Update the {label} field in the header of {path.name}",
@@ -191,10 +582,10 @@ def generate_group_rst(
         id1 = f"{counter:04d}"
         counter += 1
 
-        # Build common field lines once
-        desc_lines_full = build_field_lines("Description", hdr.description, hdr.desc_line, p)
-        input_lines_full = build_field_lines("Input", hdr.input_text, hdr.input_line, p)
-        output_lines_full = build_field_lines("Output", hdr.output_text, hdr.output_line, p)
+        # Build common field blocks once
+        desc_block = build_field_block("Description", hdr.description, p)
+        input_block_full = build_field_block("Input", hdr.input_text, p)
+        output_block_full = build_field_block("Output", hdr.output_text, p)
 
         # Split requirements into chunks of up to 7 tags per numeric step
         reqs = hdr.requirements or []
@@ -211,27 +602,25 @@ def generate_group_rst(
                 per_file_tests = format_tests_value(chunk, delimiter=" ", max_width=120, indent_spaces=14)
                 tests_line = f"      :tests: {per_file_tests}"
             else:
-                # No requirements present; fall back to warning + TODO like original behavior
+                # No requirements present; fall back to the TODO line (already reported)
                 tests_line = build_tests_line(p, hdr)
 
             # Only first numeric step contains Input/Output blocks. Others repeat Description only.
             if idx == 1:
-                desc_lines = desc_lines_full
-                input_lines = input_lines_full
-                output_lines = output_lines_full
+                input_block = input_block_full
+                output_block = output_block_full
             else:
-                desc_lines = desc_lines_full
-                input_lines = []
-                output_lines = []
+                input_block = ""
+                output_block = ""
 
             substeps.append(
                 {
                     "index": idx,
                     "id": idn,
                     "tests_line": tests_line,
-                    "desc_lines": desc_lines,
-                    "input_lines": input_lines,
-                    "output_lines": output_lines,
+                    "desc_block": desc_block,
+                    "input_block": input_block,
+                    "output_block": output_block,
                 }
             )
 
@@ -247,14 +636,7 @@ def generate_group_rst(
     section = f"{component}_oAW_{group_conv}_Tests"
 
     if Environment is not None:
-        env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=False,
-            trim_blocks=False,
-            lstrip_blocks=False,
-            keep_trailing_newline=True,
-        )
-        template = env.get_template("oaw_test_group.rst.j2")
+        template = _get_template(str(template_dir), GROUP_TEMPLATE_NAME)
         content = template.render(
             title=title,
             underline="=" * max(len(title), 120),
@@ -267,45 +649,61 @@ def generate_group_rst(
         )
     else:
         # Fallback renderer without Jinja2
-        lines: List[str] = []
-        lines.append(title)
-        lines.append("=" * max(len(title), 120))
-        lines.append("")
-        lines.append(section)
-        lines.append("-" * len(section))
-        lines.append("")
-        lines.append(f".. sw_test:: {section}")
-        lines.append(f"   :id: TS_{section}")
-        lines.append(f"   :tst_shortdescription: Tests for successful {group} of {component}")
-        lines.append("   :tst_level: Component Requirement Test")
-        lines.append(f"   :tst_designdoc: {component}_VerificationDocumentation.docx")
-        lines.append("   :tst_envconditions: oAW on PC")
-        lines.append("   :tst_method: Interface tests/API tests")
-        lines.append("   :tst_preparation: nothing specific")
-        lines.append("   :tst_type: Manual")
-        lines.append("   :tst_env: Generator-Test")
-        lines.append(f"   :tests: {tests_agg}")
-        lines.append("   See descriptions below")
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            _FALLBACK_GROUP_HEADER.format_map(
+                {
+                    "title": title,
+                    "underline": "=" * max(len(title), 120),
+                    "section": section,
+                    "section_underline": "-" * len(section),
+                    "group": group,
+                    "component": component,
+                    "tests_agg": tests_agg,
+                }
+            )
+        )
+        # Constant per group, so formatted once rather than per step.
+        step_id_prefix = f"      :id: TSS_{section}_"
         for step in steps:
-            lines.append(f"   .. sw_test_step:: {step['file_display_name']}")
-            lines.append(f"      :id: TSS_{section}_{step['id1']}")
-            lines.append("      :collapse: true")
+            write(
+                f"   .. sw_test_step:: {step['file_display_name']}\n"
+                f"{step_id_prefix}{step['id1']}\n"
+                "      :collapse: true\n"
+            )
             for sub in step["substeps"]:
-                lines.append(f"   .. sw_test_step:: {sub['index']}")
-                lines.append(f"      :id: TSS_{section}_{sub['id']}")
-                lines.append("      :collapse: true")
-                lines.append(sub["tests_line"])
-                # Description (always present)
-                lines.extend(sub["desc_lines"])
-                if sub["input_lines"]:
-                    lines.extend(sub["input_lines"])
-                    lines.extend(sub["output_lines"])
+                # Description is always present
+                write(
+                    f"   .. sw_test_step:: {sub['index']}\n"
+                    f"{step_id_prefix}{sub['id']}\n"
+                    "      :collapse: true\n"
+                    f"{sub['tests_line']}\n"
+                    f"{sub['desc_block']}\n"
+                )
+                if sub["input_block"]:
+                    write(f"{sub['input_block']}\n{sub['output_block']}\n")
                 # If no input/output lines for this substep, do not add extra trailing blank lines
-        content = "\n".join(lines)
+        # Every line was newline-terminated; the file has no final newline.
+        content = buf.getvalue()[:-1]
+
+    _write_if_changed(out_path, _encode_text(content))
+    return out_path
+
+
+def _write_if_changed(out_path: Path, data: bytes) -> None:
+    """Write ``data`` to ``out_path`` unless the file already holds exactly that.
+
+    Leaving identical files untouched keeps their mtime, so downstream Sphinx
+    builds do not reprocess them.
+    """
 
     try:
-        out_path.write_text(content, encoding="utf-8")
-        print(f"{out_path}")
+        if out_path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    try:
+        out_path.write_bytes(data)
     except Exception as ex:
         report_error(out_path, 1, f"Failed to write group RST: {ex}")
-    return out_path
@@ -1,12 +1,14 @@
 """Utilities for discovering and parsing ``.tsc`` test files."""
 
 from __future__ import annotations
+import os
 import re
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 from .config_handler import Config
-from .utils import report_error, collect_error
+from .utils import collect_error, load_json_cache, print_lines, report_error, save_json_cache
 
 
 def validate_paths(config: Config) -> None:
@@ -30,22 +32,45 @@ def discover_tsc_files(config: Config) -> List[Path]:
     """Return all test files for the component under ``config.test_path``."""
 
     prefix = f"{config.component}_"
-    results: List[Path] = []
+    found: List[str] = []
     print("Test (.tsc) files found:")
-    for path in config.test_path.rglob("*.tsc"):
-        if path.name.startswith(prefix):
-            results.append(path.resolve())
-    results.sort()
-    for p in results:
-        print(str(p))
-    if not results:
+    # Resolve the root once; paths built beneath it are then canonical apart
+    # from symlinked files, which keep their link name.
+    pending = [os.fspath(config.test_path.resolve())]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Unreadable directories are skipped, as Path.rglob did.
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                # normcase makes the suffix match case-insensitive where the
+                # platform is (Windows), like Path.rglob("*.tsc").
+                if name.startswith(prefix) and os.path.normcase(name).endswith(".tsc"):
+                    found.append(entry.path)
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    pending.append(entry.path)
+    results = sorted(Path(path) for path in found)
+    if results:
+        print_lines(results)
+    else:
         print(f"No oAW tests found for {config.component}.")
     print("")
     return results
 
 
 def group_tsc_files_by_group(component: str, tsc_files: List[Path]) -> Dict[str, List[Path]]:
-    """Group TSC files by their embedded group token."""
+    """Group TSC files by their embedded group token.
+
+    ``tsc_files`` must be sorted (as returned by :func:`discover_tsc_files`);
+    each group keeps that order.
+    """
 
     groups: Dict[str, List[Path]] = {}
     comp_prefix = component + "_"
@@ -70,14 +95,16 @@ def group_tsc_files_by_group(component: str, tsc_files: List[Path]) -> Dict[str,
             continue
         group = parts[0]
         groups.setdefault(group, []).append(file_path)
-    for group_name in groups:
-        groups[group_name].sort()
-    return dict(sorted(groups.items(), key=lambda kv: kv[0]))
+    # Group names are unique, so plain tuple ordering compares keys only.
+    return dict(sorted(groups.items()))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TscHeader:
-    """Represents parsed header metadata from a ``.tsc`` file."""
+    """Represents parsed header metadata from a ``.tsc`` file.
+
+    ``requirements`` is sorted and free of duplicates.
+    """
 
     description: str
     input_text: str
@@ -89,111 +116,202 @@ class TscHeader:
     requirements_line: int
 
 
+# Requirement tags are separated by commas and/or whitespace.
+_TAG_RE = re.compile(r"[^,\s]+")
+_SECTION_ORDER = ("description", "input", "output", "requirements")
+_SECTION_INDEX = {name: index for index, name in enumerate(_SECTION_ORDER)}
+
+
+# Per-component cache of parsed headers, written to the spec directory.
+HEADER_CACHE_NAME = ".{component}_oaw_header_cache.json"
+# Bump whenever parsing changes for unchanged .tsc files.
+_HEADER_CACHE_VERSION = 1
+
+# Read buffer for .tsc files; headers sit at the top, so one buffer usually suffices.
+HEADER_READ_SIZE = 8192
+
+
+def _join_section(lines: List[str]) -> str:
+    """Join right-stripped section lines, trimmed like ``str.strip`` but in one pass."""
+
+    start, end = 0, len(lines)
+    while start < end and not lines[start]:
+        start += 1
+    while end > start and not lines[end - 1]:
+        end -= 1
+    if start == end:
+        return ""
+    return "\n".join([lines[start].lstrip(), *lines[start + 1 : end]])
+
+
+# A parse diagnostic: 1-based line number and message.
+Diagnostic = Tuple[int, str]
+
+
 def parse_tsc_header(path: Path) -> TscHeader | None:
-    """Parse the structured comment header from a ``.tsc`` file."""
+    """Parse the structured comment header from a ``.tsc`` file.
+
+    The file is streamed line by line and reading stops where the header ends.
+    Only the header has to be valid UTF-8.
+    """
+
+    errors: List[Diagnostic] = []
+    header = _read_tsc_header(path, errors)
+    for line, message in errors:
+        collect_error(path, line, message)
+    return header
+
+
+def _read_tsc_header(path: Path, errors: List[Diagnostic]) -> TscHeader | None:
+    """Parse the header of ``path``, appending problems to ``errors``.
+
+    Nothing is reported directly, so callers on worker threads can emit the
+    diagnostics later in a deterministic order.
+    """
 
     try:
-        text = path.read_text(encoding="utf-8")
-    except Exception as ex:
-        collect_error(path, 1, f"Failed to read .tsc file: {ex}")
+        # Lines are decoded one at a time, so exactly the header lines must be
+        # valid UTF-8; bytes past the header are never decoded.
+        with path.open("rb", buffering=HEADER_READ_SIZE) as file:
+            lines = (line.decode("utf-8").rstrip("\r\n") for line in file)
+            return _parse_header_lines(errors, lines)
+    except (OSError, ValueError) as ex:
+        errors.append((1, f"Failed to read .tsc file: {ex}"))
         return None
 
-    lines = text.splitlines()
-    idx = 0
 
-    def strip_comment_prefix(s: str) -> str:
-        if not s.lstrip().startswith("//"):
-            return s
-        s2 = s.lstrip()[2:]
-        if s2.startswith(" "):
-            s2 = s2[1:]
-        return s2
+def _parse_header_lines(errors: List[Diagnostic], lines: Iterable[str]) -> TscHeader | None:
+    """Parse the header from ``lines``, stopping at the first line past it."""
 
-    sections = {"description": [], "input": [], "output": [], "requirements": []}
-    current: str | None = None
-    expected_order = ["description", "input", "output", "requirements"]
+    desc: List[str] = []
+    inp: List[str] = []
+    out: List[str] = []
+    req: List[str] = []
+    sections = (desc, inp, out, req)
+    current: List[str] | None = None
     order_index = 0
-    seen_tokens: set[str] = set()
-    header_lines: Dict[str, int] = {}
+    # Set once the Description marker is seen.
+    started = False
+    # 1-based line number of each section marker, in section order.
+    header_lines: List[int] = []
 
-    while idx < len(lines):
-        raw = lines[idx]
-        if not raw.strip():
-            if order_index > 0:
+    for idx, raw in enumerate(lines):
+        stripped = raw.lstrip()
+        if not stripped:
+            if started:
                 break
-            idx += 1
             continue
-        if raw.lstrip().startswith("//"):
-            content = strip_comment_prefix(raw)
-            header_match = re.fullmatch(r"(?i)(description|input|output|requirements)\s*", content)
-            if header_match:
-                name = header_match.group(1).lower()
-                if order_index >= len(expected_order) or name != expected_order[order_index]:
-                    collect_error(
-                        path,
-                        idx + 1,
-                        f"Unexpected or out-of-order section '{name}'",
-                    )
+        if stripped.startswith("//"):
+            # Drop "//" and at most one following space.
+            content = stripped[3:] if stripped.startswith("// ") else stripped[2:]
+            name = content.rstrip().lower()
+            expected = _SECTION_INDEX.get(name)
+            if expected is not None:
+                if expected != order_index:
+                    errors.append((idx + 1, f"Unexpected or out-of-order section '{name}'"))
                     return None
-                current = name
+                current = sections[order_index]
                 order_index += 1
-                seen_tokens.add(name)
-                header_lines[name] = idx + 1
+                started = True
+                header_lines.append(idx + 1)
             else:
                 if current is None:
-                    collect_error(
-                        path,
-                        idx + 1,
-                        "Header must start with 'Description'",
-                    )
+                    errors.append((idx + 1, "Header must start with 'Description'"))
                     return None
-                sections[current].append(content.rstrip())
-            idx += 1
+                current.append(content.rstrip())
             continue
         else:
-            if order_index == 0:
-                collect_error(path, 1, "Header missing")
+            if not started:
+                errors.append((1, "Header missing"))
                 return None
             break
 
-    missing_tokens = [tok for tok in expected_order if tok not in seen_tokens]
+    # Sections must appear in order, so the missing ones are exactly the tail.
+    missing_tokens = _SECTION_ORDER[order_index:]
     if missing_tokens:
-        collect_error(
-            path,
-            1,
-            f"Missing header section(s): {', '.join(t.capitalize() for t in missing_tokens)}",
+        errors.append(
+            (1, f"Missing header section(s): {', '.join(t.capitalize() for t in missing_tokens)}")
         )
         return None
 
-    req_line = " ".join(sections["requirements"]).replace(",", " ")
-    tags_raw = [t.strip() for t in req_line.split() if t.strip()]
-    tags = sorted(set(tags_raw))
+    # Tags never span lines, so each line is tokenized on its own. Placeholder
+    # headers leave the section empty and skip the dedupe and sort entirely.
+    tags = sorted(dict.fromkeys(tag for line in req for tag in _TAG_RE.findall(line))) if req else []
 
     return TscHeader(
-        description="\n".join(sections["description"]).strip(),
-        input_text="\n".join(sections["input"]).strip(),
-        output_text="\n".join(sections["output"]).strip(),
+        description=_join_section(desc),
+        input_text=_join_section(inp),
+        output_text=_join_section(out),
         requirements=tags,
-        desc_line=header_lines.get("description", 1),
-        input_line=header_lines.get("input", 1),
-        output_line=header_lines.get("output", 1),
-        requirements_line=header_lines.get("requirements", 1),
+        desc_line=header_lines[0],
+        input_line=header_lines[1],
+        output_line=header_lines[2],
+        requirements_line=header_lines[3],
     )
 
 
+def _parse_header_cached(
+    path: Path, cache: Dict[str, dict]
+) -> Tuple[TscHeader | None, dict | None, List[Diagnostic]]:
+    """Parse ``path`` unless ``cache`` holds its header for the same mtime and size.
+
+    Returns the header, the cache entry to store for it (if any) and the
+    diagnostics to report for the file.
+    """
+
+    errors: List[Diagnostic] = []
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # _read_tsc_header records the unreadable file.
+        return _read_tsc_header(path, errors), None, errors
+    stamp = [_HEADER_CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+    entry = cache.get(os.fspath(path))
+    if isinstance(entry, dict) and entry.get("stamp") == stamp:
+        try:
+            return TscHeader(**entry["header"]), entry, errors
+        except (KeyError, TypeError):
+            pass
+    header = _read_tsc_header(path, errors)
+    if header is None:
+        return None, None, errors
+    return header, {"stamp": stamp, "header": asdict(header)}, errors
+
+
 def parse_all_headers(
     tsc_file_groups: Dict[str, List[Path]],
+    cache_path: Path | None = None,
 ) -> Dict[str, List[Tuple[Path, TscHeader]]]:
-    """Parse headers for all grouped TSC files."""
-
-    parsed_groups: Dict[str, List[Tuple[Path, TscHeader]]] = {}
-    for group, files in tsc_file_groups.items():
-        parsed_list: List[Tuple[Path, TscHeader]] = []
-        for p in files:
-            hdr = parse_tsc_header(p)
-            if hdr is None:
-                # Skip invalid file; error already collected
-                continue
-            parsed_list.append((p, hdr))
-        parsed_groups[group] = parsed_list
+    """Parse headers for all grouped TSC files.
+
+    Files are read on a thread pool since parsing is dominated by file I/O;
+    results and errors keep the per-group file order. With ``cache_path``, headers of
+    files whose mtime and size are unchanged since the previous run are
+    loaded from that JSON cache instead of being parsed again.
+    """
+
+    cache = load_json_cache(cache_path) if cache_path is not None else {}
+    new_cache: Dict[str, dict] = {}
+    all_files = [p for files in tsc_file_groups.values() for p in files]
+    workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(all_files)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = iter(executor.map(_parse_header_cached, all_files, [cache] * len(all_files)))
+
+        parsed_groups: Dict[str, List[Tuple[Path, TscHeader]]] = {}
+        for group, files in tsc_file_groups.items():
+            parsed_list: List[Tuple[Path, TscHeader]] = []
+            for p in files:
+                hdr, entry, errors = next(results)
+                # Reported here, in file order, rather than from the workers.
+                for line, message in errors:
+                    collect_error(p, line, message)
+                if hdr is None:
+                    # Skip invalid file; error already collected
+                    continue
+                if entry is not None:
+                    new_cache[os.fspath(p)] = entry
+                parsed_list.append((p, hdr))
+            parsed_groups[group] = parsed_list
+    if cache_path is not None and new_cache != cache:
+        save_json_cache(cache_path, new_cache)
     return parsed_groups
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 from pathlib import Path
+import atexit
+import json
 import sys
+import threading
+from typing import Dict, Iterable, List
 
 
 RED = "\033[31m"
@@ -17,15 +21,46 @@ HAS_ERRORS: bool = False
 
 EXIT_FAILURE = 1
 
+# Serializes diagnostics reported from worker threads.
+_REPORT_LOCK = threading.Lock()
+
+# Pending warning lines, written to stderr in one go by flush_warnings().
+_WARNING_BUFFER: List[str] = []
+
 
 def _print_banner(text: str, color: str) -> None:
     """Render a colored banner to stdout."""
     print(f"{color}{text}{RESET}")
 
 
+def print_lines(lines: Iterable[object]) -> None:
+    """Print one item per line to stdout with a single write."""
+    text = "\n".join(map(str, lines))
+    if text:
+        sys.stdout.write(text + "\n")
+
+
+def load_json_cache(path: Path) -> Dict[str, dict]:
+    """Load a JSON cache file; a missing or unreadable cache is treated as empty."""
+    try:
+        cache = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_json_cache(path: Path, cache: Dict[str, dict]) -> None:
+    """Persist a JSON cache file; failures only cost a full rebuild next run."""
+    try:
+        path.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    except OSError:
+        pass
+
+
 def print_final_status_banner() -> None:
     """Display a summary banner reflecting overall script status."""
     global HAS_WARNINGS, HAS_ERRORS
+    flush_warnings()
     if HAS_ERRORS:
         _print_banner(
             "/-------------------\\\n| OAW TO RST FAILED |\n\\-------------------/",
@@ -55,6 +90,7 @@ def report_error(file: Path, line: int, message: str) -> None:
     """Log a fatal error, show the final banner, and exit."""
     global HAS_ERRORS
     HAS_ERRORS = True
+    flush_warnings()
     print(f"{file}:{line}: (ERROR) {message}", file=sys.stderr)
     # Print banner at the end before exiting
     print_final_status_banner()
@@ -68,8 +104,9 @@ def collect_error(file: Path, line: int, message: str) -> None:
     see all issues in one run. This function does NOT exit the process.
     """
     global HAS_ERRORS
-    HAS_ERRORS = True
-    print(f"{file}:{line}: (ERROR) {message}", file=sys.stderr)
+    with _REPORT_LOCK:
+        HAS_ERRORS = True
+        print(f"{file}:{line}: (ERROR) {message}", file=sys.stderr)
 
 
 def has_errors() -> bool:
@@ -77,8 +114,38 @@ def has_errors() -> bool:
     return HAS_ERRORS
 
 
-def report_warning(file: Path, line: int, message: str) -> None:
-    """Log a warning without halting execution."""
+def has_warnings() -> bool:
+    """Return True if any warnings have been recorded."""
+    return HAS_WARNINGS
+
+
+def flag_warnings() -> None:
+    """Record that warnings were reported elsewhere, e.g. in a worker process."""
     global HAS_WARNINGS
     HAS_WARNINGS = True
-    print(f"{file}:{line}: (WARNING) {message}", file=sys.stderr)
+
+
+def report_warning(file: Path, line: int, message: str) -> None:
+    """Log a warning without halting execution.
+
+    The message is buffered until :func:`flush_warnings` runs, which happens
+    before the final banner, before fatal errors and at interpreter exit.
+    """
+    global HAS_WARNINGS
+    with _REPORT_LOCK:
+        HAS_WARNINGS = True
+        _WARNING_BUFFER.append(f"{file}:{line}: (WARNING) {message}\n")
+
+
+def flush_warnings() -> None:
+    """Write all buffered warnings to stderr with a single write."""
+    with _REPORT_LOCK:
+        if not _WARNING_BUFFER:
+            return
+        text = "".join(_WARNING_BUFFER)
+        _WARNING_BUFFER.clear()
+    sys.stderr.write(text)
+    sys.stderr.flush()
+
+
+atexit.register(flush_warnings)
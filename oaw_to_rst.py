@@ -13,6 +13,7 @@ from pathlib import Path
 
 from lib.config_handler import load_config_with_overrides
 from lib.file_handler import (
+    HEADER_CACHE_NAME,
     validate_paths,
     discover_tsc_files,
     group_tsc_files_by_group,
@@ -21,9 +22,9 @@ from lib.file_handler import (
 from lib.file_generator import (
     find_toc_rst,
     cleanup_generated_group_files,
-    remove_generated_lines_from_toc,
-    append_group_links_to_toc,
-    generate_group_rst,
+    update_toc,
+    generate_group_rsts,
+    group_rst_filename,
 )
 from lib.utils import print_final_status_banner, has_errors, print_skipped_banner
 
@@ -36,7 +37,10 @@ def main() -> int:
 
     print("Running oAW to RST generator")
     print("----------------------------")
+    # Resolved so config/ and templates are found next to the real script,
+    # also when it is launched through a symlink.
     script_path = Path(__file__).resolve()
+    script_dir = script_path.parent
     config = load_config_with_overrides(script_path)
     validate_paths(config)
 
@@ -45,7 +49,10 @@ def main() -> int:
         return EXIT_SUCCESS
 
     tsc_file_groups = group_tsc_files_by_group(config.component, tsc_files)
-    parsed_groups = parse_all_headers(tsc_file_groups)
+    parsed_groups = parse_all_headers(
+        tsc_file_groups,
+        config.spec_path / HEADER_CACHE_NAME.format(component=config.component),
+    )
 
     # Special handling: if all .tsc files failed header validation, skip processing
     total_files = sum(len(files) for files in tsc_file_groups.values())
@@ -64,24 +71,26 @@ def main() -> int:
 
     toc_path = find_toc_rst(config.component, config.spec_path)
 
-    cleanup_generated_group_files(config.component, toc_path)
-    remove_generated_lines_from_toc(config.component, toc_path)
-    append_group_links_to_toc(
+    # Current group files are kept; generation rewrites only those that changed.
+    group_files = [
+        group_rst_filename(config.component, group, config.group_name_mappings)
+        for group in parsed_groups
+    ]
+    cleanup_generated_group_files(config.component, toc_path, keep=group_files)
+    update_toc(
         config.component, list(tsc_file_groups.keys()), toc_path, config.group_name_mappings
     )
 
-    template_dir = script_path.parent / "config" / "templates"
+    template_dir = script_dir / "config" / "templates"
     toc_dir = toc_path.parent
     print("Generated test group rst files:")
-    for group_name, parsed_list in parsed_groups.items():
-        generate_group_rst(
-            config.component,
-            group_name,
-            parsed_list,
-            toc_dir,
-            template_dir,
-            config.group_name_mappings,
-        )
+    generate_group_rsts(
+        config.component,
+        parsed_groups,
+        toc_dir,
+        template_dir,
+        config.group_name_mappings,
+    )
 
     # Print final banner based on warnings/errors
     print_final_status_banner()
@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 
+import sys
 import unittest
 
 try:
-    from tests._base import UnifiedTestCase
+    from tests._base import ROOT, UnifiedTestCase
 except ModuleNotFoundError:
     import os
-    import sys
 
     sys.path.insert(0, os.path.dirname(__file__))
-    from _base import UnifiedTestCase
+    from _base import ROOT, UnifiedTestCase
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+from lib.file_generator import format_tests_value  # noqa: E402
 
 
 class TestHeadersAndFormatting(UnifiedTestCase):
@@ -103,6 +107,15 @@ class TestHeadersAndFormatting(UnifiedTestCase):
         self.assert_regex_file(self.gen, r"^\s{13}Second line of input description\.")
         self.assert_regex_file(self.gen, r"^\s{14}Second line of output description\.")
 
+    def test_hyphenated_tags_are_not_split(self) -> None:
+        """A hyphenated tag crossing column 120 moves to the next line whole."""
+        tags = [f"SWRS-GEN-{n}" for n in range(101, 110)] + ["SWRS-UV-773"]
+        self.assertEqual(
+            format_tests_value(tags, delimiter=" ", max_width=120, indent_spaces=14),
+            "SWRS-GEN-101, SWRS-GEN-102, SWRS-GEN-103, SWRS-GEN-104, SWRS-GEN-105, SWRS-GEN-106, SWRS-GEN-107,"
+            " SWRS-GEN-108,\n" + " " * 14 + "SWRS-GEN-109, SWRS-UV-773",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
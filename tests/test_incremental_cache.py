@@ -0,0 +1,130 @@
+"""Tests verifying incremental generation and cache invalidation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+try:
+    from tests._base import ROOT
+except ModuleNotFoundError:
+    import os
+
+    sys.path.insert(0, os.path.dirname(__file__))
+    from _base import ROOT
+
+try:
+    import jinja2  # noqa: F401  # type: ignore
+
+    HAS_JINJA2 = True
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    HAS_JINJA2 = False
+
+
+class TestIncrementalCache(unittest.TestCase):
+    """Unchanged groups are kept; every kind of change regenerates them."""
+
+    def setUp(self) -> None:
+        # Work on a private copy of the tool and the example so edits stay local.
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.tool = self.tmp / "tool"
+        self.tool.mkdir()
+        shutil.copy2(ROOT / "oaw_to_rst.py", self.tool)
+        shutil.copytree(ROOT / "lib", self.tool / "lib", ignore=shutil.ignore_patterns("__pycache__"))
+        shutil.copytree(ROOT / "config", self.tool / "config")
+        shutil.copytree(ROOT / "example" / "tests", self.tmp / "tests")
+        shutil.copytree(ROOT / "example" / "spec", self.tmp / "spec")
+        for stale in (self.tmp / "spec").glob("Bogus_oAW_*.rst"):
+            stale.unlink()
+        self.config = json.loads((ROOT / "example" / "config.json").read_text(encoding="utf-8"))
+        self.write_config(self.config)
+        self.spec = self.tmp / "spec"
+        self.gen = self.spec / "Bogus_oAW_Generator_Tests.rst"
+        self.run_generator()
+
+    def write_config(self, config: dict) -> None:
+        (self.tmp / "config.json").write_text(json.dumps(config), encoding="utf-8")
+
+    def run_generator(self, *extra: str) -> None:
+        subprocess.run(
+            [sys.executable, str(self.tool / "oaw_to_rst.py"), "--config", str(self.tmp / "config.json"), *extra],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def read_gen(self) -> str:
+        return self.gen.read_text(encoding="utf-8")
+
+    def test_unchanged_run_keeps_files(self) -> None:
+        """A rerun without changes does not rewrite group files."""
+        before = self.gen.stat().st_mtime_ns
+        self.run_generator()
+        self.assertEqual(before, self.gen.stat().st_mtime_ns)
+        self.assertTrue((self.spec / ".Bogus_oaw_cache.json").exists())
+        self.assertTrue((self.spec / ".Bogus_oaw_header_cache.json").exists())
+
+    def test_edited_header_regenerates(self) -> None:
+        """Editing a .tsc header is reflected in the group file."""
+        tsc = self.tmp / "tests" / "Bogus_Generate_Primitives.tsc"
+        text = tsc.read_text(encoding="utf-8")
+        tsc.write_text(text.replace("basic bogus primitives", "edited primitives"), encoding="utf-8")
+        self.run_generator()
+        self.assertIn("edited primitives", self.read_gen())
+
+    def test_hand_edited_output_regenerates(self) -> None:
+        """A manually modified group file is restored."""
+        expected = self.read_gen()
+        with self.gen.open("a", encoding="utf-8") as file:
+            file.write("manual edit\n")
+        self.run_generator()
+        self.assertEqual(expected, self.read_gen())
+
+    def test_deleted_output_regenerates(self) -> None:
+        """A deleted group file is generated again."""
+        expected = self.read_gen()
+        self.gen.unlink()
+        self.run_generator()
+        self.assertEqual(expected, self.read_gen())
+
+    @unittest.skipUnless(HAS_JINJA2, "template is only used with Jinja2")
+    def test_changed_template_regenerates(self) -> None:
+        """Editing the group template is reflected in the group files."""
+        template = self.tool / "config" / "templates" / "oaw_test_group.rst.j2"
+        with template.open("a", encoding="utf-8") as file:
+            file.write(".. template changed\n")
+        self.run_generator()
+        self.assertTrue(self.read_gen().endswith(".. template changed\n"))
+
+    def test_changed_mapping_regenerates(self) -> None:
+        """A new group display name produces a new file and removes the old one."""
+        self.config["group_name_mappings"]["Generate"] = "Producer"
+        self.write_config(self.config)
+        self.run_generator()
+        renamed = self.spec / "Bogus_oAW_Producer_Tests.rst"
+        self.assertFalse(self.gen.exists())
+        self.assertTrue(renamed.read_text(encoding="utf-8").startswith("Producer Test Specification"))
+
+    def test_components_sharing_spec_dir_keep_their_caches(self) -> None:
+        """Runs for another component in the same directory do not evict this cache."""
+        (self.spec / "Other_component_test.rst").write_text("Other\n=====\n", encoding="utf-8")
+        shutil.copy2(
+            self.tmp / "tests" / "Bogus_Generate_Primitives.tsc",
+            self.tmp / "tests" / "Other_Generate_Primitives.tsc",
+        )
+        group_cache = self.spec / ".Bogus_oaw_cache.json"
+        header_cache = self.spec / ".Bogus_oaw_header_cache.json"
+        before = (group_cache.read_bytes(), header_cache.read_bytes())
+        self.run_generator("--component", "Other")
+        self.assertEqual(before, (group_cache.read_bytes(), header_cache.read_bytes()))
+        self.assertTrue((self.spec / ".Other_oaw_cache.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()